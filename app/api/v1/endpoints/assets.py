@@ -1,62 +1,126 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Annotated, Optional
 
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, status
+from fastapi.exceptions import RequestValidationError
+from pydantic import Field, TypeAdapter, ValidationError
+
+from app.core.logger import logger
+from app.core.responses import DecimalORJSONResponse
 from app.core.security import get_api_key
 from app.schemas.endpoints.assets import (
     AssetRequest,
     InterestRateResponse,
-    ErrorResponse
+    POSTInterestRateResponse,
+    ErrorResponse,
+    HTTPValidationError
 )
 from app.services import get_interest_rate_service, InterestRateService
 
 router = APIRouter()
 
+# Built once at import so POST /asset reuses the compiled pydantic-core validator
+_ASSET_LIST = TypeAdapter(Annotated[list[AssetRequest], Field(min_length=1)])
+
+
+def _is_json_content_type(content_type: Optional[str]) -> bool:
+    """Match FastAPI's body parsing: JSON media types, or no Content-Type at all."""
+    if not content_type:
+        return True
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    maintype, _, subtype = media_type.partition("/")
+    return maintype == "application" and (subtype == "json" or subtype.endswith("+json"))
+
+
+async def _save_average_rate(service: InterestRateService, rate_cents: int) -> None:
+    """Save the average rate after the response has been sent, logging failures."""
+    try:
+        await service.save_average_rate(rate_cents)
+    except Exception as e:
+        logger.error(f"Error saving average interest rate: {e}")
+
 
 @router.post(
     "/asset",
-    response_model=InterestRateResponse,
-    status_code=status.HTTP_200_OK,
+    response_class=DecimalORJSONResponse,
+    status_code=status.HTTP_202_ACCEPTED,
     responses={
-        400: {"model": ErrorResponse, "description": "Bad Request"},
+        422: {"model": HTTPValidationError, "description": "Validation Error"},
         500: {"model": ErrorResponse, "description": "Internal Server Error"}
     },
     summary="Update Assets and Calculate Average Interest Rate",
-    description="Receives a list of assets and updates the average interest rate"
+    description="Receives a list of assets and updates the average interest rate",
+    # The body is parsed manually, so document it explicitly
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": {
+                        "type": "array",
+                        "minItems": 1,
+                        "items": AssetRequest.model_json_schema(),
+                    }
+                }
+            },
+        }
+    }
 )
 async def update_assets(
-    assets: list[AssetRequest],
+    request: Request,
+    background_tasks: BackgroundTasks,
     api_key: str = Depends(get_api_key),
     service: InterestRateService = Depends(get_interest_rate_service),
-):
+) -> POSTInterestRateResponse:
     """
     Update assets and calculate the average interest rate.
     
+    The average is calculated in the request, while saving it to storage runs
+    as a background task after the 202 response is sent.
+    
     Args:
-        assets: List of assets with their interest rates (as per README.md example)
+        request: Incoming request whose JSON body is the list of assets
+            (as per README.md example)
+        background_tasks: FastAPI background tasks used to save the rate
         api_key: API key for authentication
         
     Returns:
-        InterestRateResponse: The calculated average interest rate
+        POSTInterestRateResponse: Confirmation that the update was accepted
         
     Raises:
-        HTTPException: If the request data is invalid or processing fails
+        RequestValidationError: If the body is not a non-empty JSON list of assets,
+            or their average interest rate is too large to store
+        HTTPException: If processing fails
     """
+    body = await request.body()
     try:
-        # Calculate and save average interest rate
-        average_rate = await service.calculate_and_save_average_rate(assets)
-        
-        # Get the stored data to return with timestamp
-        result = await service.get_current_rate()
-        _, timestamp = result
+        if _is_json_content_type(request.headers.get("content-type")):
+            assets = _ASSET_LIST.validate_json(body)
+        else:
+            # Non-JSON bodies are not parsed; they fail as a list_type error like in FastAPI
+            assets = _ASSET_LIST.validate_python(body)
+    except ValidationError as e:
+        # Inputs are left out: non-finite floats (e.g. 1e400) cannot be rendered as JSON
+        errors = e.errors(include_url=False, include_input=False)
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in errors]
+        )
+    
+    try:
+        # Calculate now, save once the response has been sent
+        rate_cents = service.calculate_average_rate(assets)
+        background_tasks.add_task(_save_average_rate, service, rate_cents)
         
-        return InterestRateResponse(
-            interest_rate=average_rate,
-            updated_at=timestamp
+        response = POSTInterestRateResponse(message="Average interest rate accepted for update")
+        return DecimalORJSONResponse(
+            response.model_dump(mode="json"),
+            status_code=status.HTTP_202_ACCEPTED
         )
         
     except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid request data: {str(e)}"
+        raise RequestValidationError(
+            [{"type": "value_error", "loc": ("body",), "msg": str(e)}]
         )
     except Exception as e:
         raise HTTPException(
@@ -67,7 +131,7 @@ async def update_assets(
 
 @router.get(
     "/interest_rate",
-    response_model=InterestRateResponse,
+    response_class=DecimalORJSONResponse,
     status_code=status.HTTP_200_OK,
     responses={
         404: {"model": ErrorResponse, "description": "Interest rate not found"},
@@ -79,7 +143,7 @@ async def update_assets(
 async def get_interest_rate(
     api_key: str = Depends(get_api_key),
     service: InterestRateService = Depends(get_interest_rate_service),
-):
+) -> InterestRateResponse:
     """
     Get the current average interest rate.
     
@@ -102,12 +166,13 @@ async def get_interest_rate(
                 detail="No interest rate found. Please update assets first."
             )
         
-        rate, timestamp = result
+        rate_cents, timestamp = result
         
-        return InterestRateResponse(
-            interest_rate=rate,
-            updated_at=timestamp
+        response = InterestRateResponse(
+            interest_rate=Decimal(rate_cents).scaleb(-2),
+            updated_at=datetime.fromtimestamp(timestamp, tz=timezone.utc).isoformat()
         )
+        return DecimalORJSONResponse(response.model_dump(mode="json"))
         
     except HTTPException:
         raise
@@ -1,8 +1,19 @@
+from functools import lru_cache
+
+from pydantic import Field
 from pydantic_settings import BaseSettings
 from decouple import config
 
 class Settings(BaseSettings):
     API_KEY_NAME: str = config("API_KEY_NAME", default="api_key", cast=str)
     API_KEY_AUTH: str = config("API_KEY_AUTH", default="", cast=str)
+    STORAGE_MAX_CONCURRENT_WRITES: int = Field(
+        config("STORAGE_MAX_CONCURRENT_WRITES", default=8, cast=int), ge=1
+    )
+    INTEREST_RATE_CACHE_TTL: float = config("INTEREST_RATE_CACHE_TTL", default=5.0, cast=float)
+
 
-settings = Settings()
\ No newline at end of file
+@lru_cache
+def get_settings() -> Settings:
+    """Load the application settings once per process."""
+    return Settings()
@@ -0,0 +1,25 @@
+from decimal import Decimal
+from typing import Any
+
+import orjson
+from fastapi.responses import ORJSONResponse
+
+
+def _orjson_default(obj: Any) -> Any:
+    """Serialize types orjson does not handle natively."""
+    if isinstance(obj, Decimal):
+        return str(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class DecimalORJSONResponse(ORJSONResponse):
+    """
+    ORJSONResponse that serializes Decimal values as strings.
+
+    The asset routes pass already JSON-ready ``model_dump(mode="json")`` output,
+    so the Decimal default is only a fallback for content that still holds
+    Decimal values.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_orjson_default)
@@ -1,10 +1,12 @@
+import hmac
+
 from fastapi import HTTPException, Security, Depends
 from fastapi.security.api_key import APIKeyHeader
 from starlette.status import HTTP_403_FORBIDDEN
-from app.core.config import settings
+from app.core.config import get_settings
 
 
-API_KEY_NAME = settings.API_KEY_NAME
+API_KEY_NAME = get_settings().API_KEY_NAME
 api_key_header = APIKeyHeader(name=API_KEY_NAME, auto_error=False)
 
 
@@ -28,7 +30,8 @@ async def get_api_key(
             status_code=HTTP_403_FORBIDDEN, detail="No API key provided"
         )
 
-    if api_key_header != settings.API_KEY_AUTH:
+    expected_key = get_settings().API_KEY_AUTH.encode()
+    if not hmac.compare_digest(api_key_header.encode(), expected_key):
         raise HTTPException(status_code=HTTP_403_FORBIDDEN, detail="Invalid API key")
 
     return api_key_header
@@ -1,8 +1,10 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from contextlib import asynccontextmanager
 import asyncio
 from app.core.logger import logger
+from app.core.responses import DecimalORJSONResponse
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -23,6 +25,7 @@ app = FastAPI(
     version="1.0.0",
     description="Fence Test",
     lifespan=lifespan,
+    default_response_class=DecimalORJSONResponse,
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json",
@@ -36,6 +39,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger JSON bodies; small responses are passed through untouched
+app.add_middleware(GZipMiddleware, minimum_size=500, compresslevel=5)
+
 # Include the API routes (exact paths as per README.md)
 from app.api.v1.router import api_router
 
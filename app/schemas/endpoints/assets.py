@@ -2,19 +2,19 @@
 Schemas for asset-related endpoints.
 """
 from pydantic import BaseModel, Field
-from typing import List
+from typing import List, Union
 from decimal import Decimal
 
 
 class AssetRequest(BaseModel):
     """Request schema for a single asset."""
     id: str = Field(..., description="Unique identifier for the asset")
-    interest_rate: Decimal = Field(..., ge=0, description="Interest rate for the asset")
-    
-    class Config:
-        json_encoders = {
-            Decimal: str
-        }
+    interest_rate: float = Field(
+        ...,
+        ge=0,
+        allow_inf_nan=False,
+        description="Interest rate for the asset"
+    )
 
 
 class AssetListRequest(BaseModel):
@@ -38,7 +38,24 @@ class InterestRateResponse(BaseModel):
         }
 
 
+class POSTInterestRateResponse(BaseModel):
+    """Response schema for the asset update endpoint."""
+    message: str = Field(..., description="Status of the interest rate update")
+
+
 class ErrorResponse(BaseModel):
     """Error response schema."""
     error: str = Field(..., description="Error message")
     detail: str = Field(None, description="Additional error details")
+
+
+class ValidationErrorDetail(BaseModel):
+    """A single request validation error."""
+    loc: List[Union[str, int]] = Field(..., description="Location of the invalid value")
+    msg: str = Field(..., description="Error message")
+    type: str = Field(..., description="Error type")
+
+
+class HTTPValidationError(BaseModel):
+    """Validation error response schema."""
+    detail: List[ValidationErrorDetail] = Field(..., description="Validation errors")
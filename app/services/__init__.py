@@ -1,7 +1,15 @@
+from functools import lru_cache
+
 from app.services.interest_rate_service import InterestRateService, InterestRateStorage
 
 
-def get_interest_rate_service() -> InterestRateService:
-    """Get the interest rate service instance."""
+@lru_cache
+def _build_interest_rate_service() -> InterestRateService:
+    """Build the interest rate service once per process."""
     storage = InterestRateStorage()
     return InterestRateService(storage)
+
+
+async def get_interest_rate_service() -> InterestRateService:
+    """Get the interest rate service instance."""
+    return _build_interest_rate_service()
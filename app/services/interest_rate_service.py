@@ -1,22 +1,33 @@
+import asyncio
+import math
+import statistics
+import time
 from abc import ABC, abstractmethod
 from typing import Optional, List
-from decimal import Decimal
-from datetime import datetime, timezone
 
+from ..core.config import get_settings
 from ..schemas.endpoints.assets import AssetRequest
 
 
 class InterestRateStorage(ABC):
-    """Abstract storage interface for interest rate data."""
+    """
+    Abstract storage interface for interest rate data.
+
+    Methods are awaited directly on the event loop, so implementations must
+    use non-blocking clients (e.g. ``sqlalchemy.ext.asyncio``/``asyncpg``)
+    rather than synchronous drivers. Rates are exchanged as integer cents
+    (hundredths of a percentage point), e.g. ``5500`` for ``55.00``, and
+    timestamps as integer Unix seconds (UTC).
+    """
     
     @abstractmethod
-    async def save_interest_rate(self, rate: Decimal, timestamp: str) -> None:
-        """Save an interest rate with timestamp."""
+    async def save_interest_rate(self, rate_cents: int, timestamp: int) -> None:
+        """Save an interest rate (in cents) with timestamp."""
         pass
     
     @abstractmethod
-    async def get_current_interest_rate(self) -> Optional[tuple[Decimal, str]]:
-        """Get the current interest rate and timestamp."""
+    async def get_current_interest_rate(self) -> Optional[tuple[int, int]]:
+        """Get the current interest rate (in cents) and timestamp."""
         pass
 
 
@@ -25,40 +36,85 @@ class InterestRateService:
     
     def __init__(self, storage: InterestRateStorage):
         self.storage = storage
+        # Cache of the current rate: (rate in cents, Unix timestamp, monotonic time cached)
+        self._rate_cache: Optional[tuple[int, int, float]] = None
+        self._rate_cache_lock = asyncio.Lock()
+        # Bounds concurrent storage writes so background saves cannot flood the backend
+        self._write_semaphore = asyncio.Semaphore(get_settings().STORAGE_MAX_CONCURRENT_WRITES)
     
-    async def calculate_and_save_average_rate(self, assets: List[AssetRequest]) -> Decimal:
+    def calculate_average_rate(self, assets: List[AssetRequest]) -> int:
         """
-        Calculate average interest rate from assets and save it.
+        Calculate average interest rate from assets without saving it.
         
         Args:
             assets: List of assets with their interest rates
             
         Returns:
-            Decimal: The calculated average interest rate
+            int: The calculated average interest rate in cents
             
         Raises:
-            ValueError: If assets list is empty or invalid
+            ValueError: If assets list is empty or the average is too large to store
         """
-        if not assets:
-            raise ValueError("Asset list cannot be empty")
-        
-        # Calculate average interest rate
-        total_rate = sum(asset.interest_rate for asset in assets)
-        average_rate = total_rate / len(assets)
+        # Average in float and round once to integer cents
+        try:
+            average = statistics.fmean(asset.interest_rate for asset in assets)
+        except OverflowError:
+            raise ValueError("Average interest rate is too large")
+        rate = average * 100
+        if not math.isfinite(rate):
+            raise ValueError("Average interest rate is too large")
+        return round(rate)
+    
+    async def save_average_rate(self, rate_cents: int) -> None:
+        """
+        Save an already calculated average interest rate with the current timestamp.
         
-        # Get current timestamp
-        current_time = datetime.now(timezone.utc).isoformat()
+        Args:
+            rate_cents: The average interest rate to store, in cents
+        """
+        # Unix seconds; formatted to ISO only when building a response
+        current_time = int(time.time())
         
         # Save to storage
-        await self.storage.save_interest_rate(average_rate, current_time)
-        
-        return average_rate
+        async with self._write_semaphore:
+            await self.storage.save_interest_rate(rate_cents, current_time)
+        await self._invalidate_cache()
     
-    async def get_current_rate(self) -> Optional[tuple[Decimal, str]]:
+    async def get_current_rate(self) -> Optional[tuple[int, int]]:
         """
         Get the current stored interest rate.
         
         Returns:
-            Optional[tuple[Decimal, str]]: Rate and timestamp, or None if not found
+            Optional[tuple[int, int]]: Rate in cents and Unix timestamp, or None if not found
         """
-        return await self.storage.get_current_interest_rate()
\ No newline at end of file
+        cached = self._get_cached_rate()
+        if cached is not None:
+            return cached
+
+        async with self._rate_cache_lock:
+            # Another request may have refreshed the cache while we waited
+            cached = self._get_cached_rate()
+            if cached is not None:
+                return cached
+
+            result = await self.storage.get_current_interest_rate()
+            if result is not None:
+                rate_cents, timestamp = result
+                self._rate_cache = (rate_cents, timestamp, time.monotonic())
+            return result
+
+    def _get_cached_rate(self) -> Optional[tuple[int, int]]:
+        """Return the cached rate and timestamp if still within the TTL."""
+        cached = self._rate_cache
+        if cached is None:
+            return None
+        rate_cents, timestamp, cached_at = cached
+        if time.monotonic() - cached_at >= get_settings().INTEREST_RATE_CACHE_TTL:
+            return None
+        return rate_cents, timestamp
+
+    async def _invalidate_cache(self) -> None:
+        """Drop the cached rate so the next read goes to storage."""
+        # Taking the lock waits out any in-flight read that could repopulate stale data
+        async with self._rate_cache_lock:
+            self._rate_cache = None